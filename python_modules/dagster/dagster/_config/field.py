@@ -320,7 +320,15 @@ def __init__(
 
             # on implicitly optional - set the default value
             # by resolving the defaults of the type
-            if is_optional and not self.default_provided:
+            if (
+                is_optional
+                and not self.default_provided
+                and self.config_type.kind == ConfigTypeKind.NONEABLE
+            ):
+                # the implicit default of a Noneable is always None, so skip building the
+                # schema snapshot needed to resolve it
+                self._default_value = None
+            elif is_optional and not self.default_provided:
                 evr = resolve_defaults(self.config_type, None)
                 if not evr.success:
                     raise DagsterInvalidConfigError(
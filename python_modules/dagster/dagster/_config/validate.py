@@ -1,5 +1,5 @@
 from collections.abc import Mapping, Sequence
-from typing import Any, Optional, TypeVar, cast
+from typing import Any, Callable, Optional, TypeVar, cast
 
 import dagster._check as check
 from dagster._config.config_type import ConfigScalarKind, ConfigType, ConfigTypeKind
@@ -36,22 +36,44 @@
 T = TypeVar("T")
 
 
+def _is_valid_int(config_value: object) -> bool:
+    return not isinstance(config_value, bool) and isinstance(config_value, int)
+
+
+def _is_valid_string(config_value: object) -> bool:
+    return isinstance(config_value, str)
+
+
+def _is_valid_bool(config_value: object) -> bool:
+    return isinstance(config_value, bool)
+
+
+def _is_valid_float(config_value: object) -> bool:
+    return isinstance(config_value, VALID_FLOAT_TYPES)
+
+
+# Resolve the validator for each scalar kind once, rather than walking a chain of comparisons
+# against the snap's scalar kind every time a scalar value is validated.
+_SCALAR_VALIDATORS_BY_KIND: Mapping[ConfigScalarKind, Callable[[object], bool]] = {
+    ConfigScalarKind.INT: _is_valid_int,
+    ConfigScalarKind.STRING: _is_valid_string,
+    ConfigScalarKind.BOOL: _is_valid_bool,
+    ConfigScalarKind.FLOAT: _is_valid_float,
+}
+
+
 def is_config_scalar_valid(config_type_snap: ConfigTypeSnap, config_value: object) -> bool:
     check.inst_param(config_type_snap, "config_type_snap", ConfigTypeSnap)
     check.param_invariant(config_type_snap.kind == ConfigTypeKind.SCALAR, "config_type_snap")
-    if config_type_snap.scalar_kind == ConfigScalarKind.INT:
-        return not isinstance(config_value, bool) and isinstance(config_value, int)
-    elif config_type_snap.scalar_kind == ConfigScalarKind.STRING:
-        return isinstance(config_value, str)
-    elif config_type_snap.scalar_kind == ConfigScalarKind.BOOL:
-        return isinstance(config_value, bool)
-    elif config_type_snap.scalar_kind == ConfigScalarKind.FLOAT:
-        return isinstance(config_value, VALID_FLOAT_TYPES)
-    elif config_type_snap.scalar_kind is None:
+    scalar_kind = config_type_snap.scalar_kind
+    if scalar_kind is None:
         # historical snapshot without scalar kind. do no validation
         return True
-    else:
+
+    validator = _SCALAR_VALIDATORS_BY_KIND.get(scalar_kind)
+    if validator is None:
         check.failed(f"Not a supported scalar {config_type_snap}")
+    return validator(config_value)
 
 
 def validate_config(config_schema: object, config_value: T) -> EvaluateValueResult[T]:
@@ -145,20 +145,33 @@ def has_input_asset(self, key: "AssetKey") -> bool:
 
     @staticmethod
     def from_tags(tags: Mapping[str, str]) -> Optional["DataProvenance"]:
+        from dagster._core.definitions.events import AssetKey
+
         code_version = tags.get(CODE_VERSION_TAG)
         if code_version is None:
             return None
-        input_data_versions = {
-            _asset_key_from_tag(k): DataVersion(v)
-            for k, v in tags.items()
-            if k.startswith(INPUT_DATA_VERSION_TAG_PREFIX)
-            or k.startswith(_OLD_INPUT_DATA_VERSION_TAG_PREFIX)
-        }
-        input_storage_ids = {
-            _asset_key_from_tag(k): int(v) if v != NULL_EVENT_POINTER else None
-            for k, v in tags.items()
-            if k.startswith(INPUT_EVENT_POINTER_TAG_PREFIX)
-        }
+        input_data_versions: dict[AssetKey, DataVersion] = {}
+        input_storage_ids: dict[AssetKey, Optional[int]] = {}
+        # Each input has both a data version and an event pointer tag, so collect both in a single
+        # pass and parse each input's asset key only once.
+        asset_keys_by_user_string: dict[str, AssetKey] = {}
+        for k, v in tags.items():
+            if k.startswith(_INPUT_DATA_VERSION_TAG_PREFIXES):
+                is_data_version = True
+            elif k.startswith(INPUT_EVENT_POINTER_TAG_PREFIX):
+                is_data_version = False
+            else:
+                continue
+            # Everything after the 2nd slash is the asset key
+            user_string = k.split("/", maxsplit=2)[-1]
+            asset_key = asset_keys_by_user_string.get(user_string)
+            if asset_key is None:
+                asset_key = AssetKey.from_user_string(user_string)
+                asset_keys_by_user_string[user_string] = asset_key
+            if is_data_version:
+                input_data_versions[asset_key] = DataVersion(v)
+            else:
+                input_storage_ids[asset_key] = int(v) if v != NULL_EVENT_POINTER else None
         is_user_provided = tags.get(DATA_VERSION_IS_USER_PROVIDED_TAG) == "true"
         return DataProvenance(
             code_version, input_data_versions, input_storage_ids, is_user_provided
@@ -170,13 +183,6 @@ def input_logical_versions(self) -> Mapping["AssetKey", DataVersion]:
         return self.input_data_versions
 
 
-def _asset_key_from_tag(tag: str) -> "AssetKey":
-    from dagster._core.definitions.events import AssetKey
-
-    # Everything after the 2nd slash is the asset key
-    return AssetKey.from_user_string(tag.split("/", maxsplit=2)[-1])
-
-
 # ########################
 # ##### TAG KEYS
 # ########################
@@ -187,6 +193,10 @@ def _asset_key_from_tag(tag: str) -> "AssetKey":
 INPUT_DATA_VERSION_TAG_PREFIX: Final[str] = "dagster/input_data_version"
 _OLD_INPUT_DATA_VERSION_TAG_PREFIX: Final[str] = "dagster/input_logical_version"
 INPUT_EVENT_POINTER_TAG_PREFIX: Final[str] = "dagster/input_event_pointer"
+_INPUT_DATA_VERSION_TAG_PREFIXES: Final[tuple[str, ...]] = (
+    INPUT_DATA_VERSION_TAG_PREFIX,
+    _OLD_INPUT_DATA_VERSION_TAG_PREFIX,
+)
 DATA_VERSION_IS_USER_PROVIDED_TAG = "dagster/data_version_is_user_provided"
 
 
@@ -240,14 +250,21 @@ def compute_logical_data_version(
     ):
         return UNKNOWN_DATA_VERSION
 
+    if not input_data_versions:
+        return _hash_data_version_inputs((code_version,))
+
     ordered_input_versions = [
         input_data_versions[k] for k in sorted(input_data_versions.keys(), key=str)
     ]
     all_inputs = (code_version, *(v.value for v in ordered_input_versions))
+    return _hash_data_version_inputs(all_inputs)
+
 
-    hash_sig = sha256()
-    hash_sig.update(bytearray("".join(all_inputs), "utf8"))
-    return DataVersion(hash_sig.hexdigest())
+# The same code/input version combinations recur across steps and asset graph traversals, so
+# memoize the hash on the ordered version strings (the only thing the hash depends on).
+@functools.lru_cache(maxsize=1024)
+def _hash_data_version_inputs(all_inputs: tuple[str, ...]) -> DataVersion:
+    return DataVersion(sha256("".join(all_inputs).encode("utf8")).hexdigest())
 
 
 def extract_data_version_from_entry(
@@ -300,6 +317,9 @@ class StaleCause(
         ],
     )
 ):
+    # Causes are created per dependency edge, so don't give each one an instance dict
+    __slots__ = ()
+
     def __new__(
         cls,
         key: Union["AssetKey", "AssetKeyPartitionKey"],
@@ -337,9 +357,7 @@ def dependency_partition_key(self) -> Optional[str]:
 
     @property
     def sort_key(self) -> str:
-        if not hasattr(self, "_sort_key"):
-            self._sort_key = f"{self.key}/{self.dependency}" if self.dependency else str(self.key)
-        return self._sort_key
+        return f"{self.key}/{self.dependency}" if self.dependency else str(self.key)
 
     @property
     def dedupe_key(self) -> int:
@@ -557,6 +575,12 @@ def _get_stale_causes_materialized(self, key: "AssetKeyPartitionKey") -> Iterato
         # constraint can be removed when we have thoroughly tested performance for large upstream
         # partition counts.
         partition_deps = self._get_partition_dependencies(key=key)
+
+        # Unpartitioned deps are resolved from their asset records, so fetch those in one batch
+        # rather than one query per dep.
+        self.instance_queryer.prefetch_asset_records(
+            dep_key.asset_key for dep_key in partition_deps if dep_key.partition_key is None
+        )
         for dep_key in sorted(partition_deps):
             dep_asset = self.asset_graph.get(dep_key.asset_key)
             if provenance:
@@ -15,6 +15,7 @@
 
 if TYPE_CHECKING:
     from dagster._core.definitions.asset_selection import CoercibleToAssetSelection
+    from dagster._core.definitions.job_definition import JobDefinition
     from dagster._core.execution.execute_in_process_result import ExecuteInProcessResult
 
 EPHEMERAL_JOB_NAME = "__ephemeral_asset_job__"
@@ -83,28 +84,11 @@ def asset2(asset1):
             # executes a run that materializes just asset2, loading its input from asset1
             materialize([asset1, asset2], selection=[asset2])
     """
-    from dagster._core.definitions.definitions_class import Definitions
-
-    assets = check.sequence_param(
-        assets, "assets", of_type=(AssetsDefinition, AssetSpec, SourceAsset)
-    )
+    job_def = _build_ephemeral_asset_job(assets, resources, selection)
     instance = check.opt_inst_param(instance, "instance", DagsterInstance)
     partition_key = check.opt_str_param(partition_key, "partition_key")
-    resources = check.opt_mapping_param(resources, "resources", key_type=str)
 
-    defs = Definitions(
-        jobs=[define_asset_job(name=EPHEMERAL_JOB_NAME, selection=selection)],
-        assets=assets,
-        resources=resources,
-    )
-
-    # validate input asset graph and resources
-    defs.resolve_all_job_defs()
-
-    return check.not_none(
-        defs.resolve_job_def(EPHEMERAL_JOB_NAME),
-        "This should always return a job",
-    ).execute_in_process(
+    return job_def.execute_in_process(
         run_config=run_config,
         instance=instance,
         partition_key=partition_key,
@@ -206,6 +190,34 @@ def asset2(asset1):
     )
 
 
+def _build_ephemeral_asset_job(
+    assets: Sequence[Union[AssetsDefinition, AssetSpec, SourceAsset]],
+    resources: Optional[Mapping[str, object]],
+    selection: Optional["CoercibleToAssetSelection"],
+) -> "JobDefinition":
+    """Builds and validates the job that `materialize` executes."""
+    from dagster._core.definitions.definitions_class import Definitions
+
+    assets = check.sequence_param(
+        assets, "assets", of_type=(AssetsDefinition, AssetSpec, SourceAsset)
+    )
+    resources = check.opt_mapping_param(resources, "resources", key_type=str)
+
+    defs = Definitions(
+        jobs=[define_asset_job(name=EPHEMERAL_JOB_NAME, selection=selection)],
+        assets=assets,
+        resources=resources,
+    )
+
+    # validate input asset graph and resources
+    defs.resolve_all_job_defs()
+
+    return check.not_none(
+        defs.resolve_job_def(EPHEMERAL_JOB_NAME),
+        "This should always return a job",
+    )
+
+
 def _get_required_io_manager_keys(
     assets: Sequence[Union[AssetsDefinition, AssetSpec, SourceAsset]],
 ) -> set[str]:
@@ -1,11 +1,11 @@
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Mapping
-from functools import cache
+from functools import cache, cached_property
 from typing import AbstractSet, Any, Optional  # noqa: UP035
 
 from dagster_shared.dagster_model import DagsterModel
 from dagster_shared.dagster_model.pydantic_compat_layer import model_fields
-from typing_extensions import TypeVar
+from typing_extensions import Self, TypeVar
 
 from dagster import _check as check
 from dagster._core.definitions.metadata.metadata_value import (
@@ -55,18 +55,47 @@ def _namespaced_key(cls, key: str) -> str:
     def _strip_namespace_from_key(key: str) -> str:
         return key.split("/", 1)[1]
 
-    def keys(self) -> Iterable[str]:
-        return [
-            self._namespaced_key(key)
-            for key in model_fields(self.__class__).keys()
+    @classmethod
+    @cache  # field names are fixed per class, so only build the namespaced keys once
+    def _namespaced_keys_by_field_name(cls) -> Mapping[str, str]:
+        return {key: cls._namespaced_key(key) for key in model_fields(cls).keys()}
+
+    @cached_property
+    def _field_values(self) -> tuple[Any, ...]:
+        # instances are frozen, so this only needs to be computed once per instance
+        return tuple(
             # getattr returns the pydantic property on the subclass
-            if getattr(self, key) is not None
-        ]
+            getattr(self, field_name)
+            for field_name in self._namespaced_keys_by_field_name().keys()
+        )
+
+    @cached_property
+    def _namespaced_values(self) -> Mapping[str, Any]:
+        return {
+            namespaced_key: value
+            for namespaced_key, value in zip(
+                self._namespaced_keys_by_field_name().values(), self._field_values
+            )
+            if value is not None
+        }
+
+    def keys(self) -> Iterable[str]:
+        return list(self._namespaced_values.keys())
 
     def __getitem__(self, key: str) -> Any:
+        namespaced_values = self._namespaced_values
+        if key in namespaced_values:
+            return namespaced_values[key]
         # getattr returns the pydantic property on the subclass
         return getattr(self, self._strip_namespace_from_key(key))
 
+    def model_copy(self, *, update: Optional[dict[str, Any]] = None) -> Self:
+        copied = super().model_copy(update=update)
+        # the copy shares the cached values of the original, which may be stale
+        copied.__dict__.pop("_field_values", None)
+        copied.__dict__.pop("_namespaced_values", None)
+        return copied
+
     @classmethod
     def extract(cls: type[T_NamespacedKVSet], values: Mapping[str, Any]) -> T_NamespacedKVSet:
         """Extracts entries from the provided dictionary into an instance of this class.
@@ -143,6 +172,15 @@ def __init__(self, *args, **kwargs) -> None:
                 )
         super().__init__(*args, **kwargs)
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, NamespacedMetadataSet):
+            return NotImplemented
+        # compare the packed field values directly rather than going through the model dicts
+        return type(self) is type(other) and self._field_values == other._field_values
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._field_values))
+
     @classmethod
     def _extract_value(cls, field_name: str, value: Any) -> Any:
         """Based on type annotation, potentially coerce the metadata value to its inner value.
@@ -143,9 +143,11 @@ def __init__(self, cursor: Optional[str], context: "MultiAssetSensorEvaluationCo
         self._context = context
 
     def get_cursor_for_asset(self, asset_key: AssetKey) -> MultiAssetSensorAssetCursorComponent:
-        return self._cursor_component_by_asset_key.get(
-            str(asset_key), MultiAssetSensorAssetCursorComponent(None, None, {})
-        )
+        cursor_component = self._cursor_component_by_asset_key.get(str(asset_key))
+        if cursor_component is None:
+            # only build the empty component when the asset has no cursor yet
+            return MultiAssetSensorAssetCursorComponent(None, None, {})
+        return cursor_component
 
     def get_stringified_cursor(self) -> str:
         return json.dumps(self._cursor_component_by_asset_key)
@@ -408,20 +410,24 @@ def latest_materialization_records_by_key(
         else:
             asset_keys = check.opt_sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
 
-        asset_records = self.instance.get_asset_records(asset_keys)
-
         asset_event_records: dict[AssetKey, Optional[EventLogRecord]] = {
             asset_key: None for asset_key in asset_keys
         }
-        for record in asset_records:
-            if (
-                record.asset_entry.last_materialization_record
-                and record.asset_entry.last_materialization_record.storage_id
-                > (self._get_cursor(record.asset_entry.asset_key).latest_consumed_event_id or 0)
-            ):
-                asset_event_records[record.asset_entry.asset_key] = (
-                    record.asset_entry.last_materialization_record
-                )
+        if not asset_event_records:
+            return asset_event_records
+
+        # A single batched lookup against the asset entries, which already track the latest
+        # materialization per key, so there is no per-key event log query.
+        for record in self.instance.get_asset_records(asset_keys):
+            asset_entry = record.asset_entry
+            last_materialization_record = asset_entry.last_materialization_record
+            if last_materialization_record is None:
+                continue
+            latest_consumed_event_id = self._get_cursor(
+                asset_entry.asset_key
+            ).latest_consumed_event_id
+            if last_materialization_record.storage_id > (latest_consumed_event_id or 0):
+                asset_event_records[asset_entry.asset_key] = last_materialization_record
 
         return asset_event_records
 
@@ -5,8 +5,6 @@
 from functools import lru_cache, reduce
 from typing import TYPE_CHECKING, Optional, Union, cast
 
-from dagster_shared.check.functions import CheckError
-
 import dagster._check as check
 from dagster._annotations import public
 from dagster._core.definitions.partitions.context import (
@@ -191,10 +189,14 @@ def get_partitions_def_for_dimension(self, dimension_name: str) -> PartitionsDef
     # We override the default implementation of `has_partition_key` for performance.
     def has_partition_key(self, partition_key: Union[MultiPartitionKey, str]) -> bool:
         if isinstance(partition_key, str):
-            try:
-                partition_key = self.get_partition_key_from_str(partition_key)
-            except CheckError:
+            # check each dimension's value directly, without building a MultiPartitionKey
+            partition_key_strs = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+            if len(partition_key_strs) != len(self._partitions_defs):
                 return False
+            return all(
+                dimension.partitions_def.has_partition_key(dimension_key)
+                for dimension, dimension_key in zip(self._partitions_defs, partition_key_strs)
+            )
 
         if partition_key.keys_by_dimension.keys() != set(self.partition_dimension_names):
             raise DagsterUnknownPartitionError(
@@ -272,18 +274,22 @@ def get_paginated_partition_keys(
                 cursor=MultiPartitionCursor.from_cursor(cursor),
                 ascending=ascending,
             )
-            next_cursor = cursor
             while iterator.has_next():
                 partition_key = next(iterator)
                 if not partition_key:
                     break
 
                 partition_keys.append(partition_key)
-                next_cursor = iterator.cursor().to_string()
                 if len(partition_keys) >= limit:
                     break
 
-            if not next_cursor:
+            # the cursor only encodes the last key emitted, so it is built once per page rather
+            # than once per key
+            if partition_keys:
+                next_cursor = iterator.cursor().to_string()
+            elif cursor:
+                next_cursor = cursor
+            else:
                 next_cursor = MultiPartitionCursor(last_seen_key=None).to_string()
 
             return PaginatedResults(
@@ -1,5 +1,6 @@
 from collections.abc import Sequence
 from datetime import datetime
+from functools import cached_property
 from typing import Optional
 
 import dagster._check as check
@@ -73,6 +74,15 @@ def get_partition_keys(
         """
         return self._partition_keys
 
+    @cached_property
+    def _partition_key_set(self) -> frozenset[str]:
+        return frozenset(self._partition_keys)
+
+    # We override the default implementation of `has_partition_key` to avoid a linear scan of the
+    # partition keys.
+    def has_partition_key(self, partition_key: str) -> bool:
+        return partition_key in self._partition_key_set
+
     def get_paginated_partition_keys(
         self,
         context: PartitionLoadingContext,
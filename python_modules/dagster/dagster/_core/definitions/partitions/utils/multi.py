@@ -1,5 +1,6 @@
 import base64
 import json
+import sys
 from collections.abc import Mapping
 from typing import TYPE_CHECKING, NamedTuple, Optional, cast
 
@@ -27,6 +28,12 @@
 MULTIPARTITION_KEY_DELIMITER = "|"
 
 
+def _intern_dimension_name(dimension_name: str) -> str:
+    # Dimension names repeat across every key of a multi-partitions definition, so share a single
+    # string instance for each rather than holding a copy per deserialized key.
+    return sys.intern(dimension_name) if type(dimension_name) is str else dimension_name
+
+
 def has_one_dimension_time_window_partitioning(
     partitions_def: Optional["PartitionsDefinition"],
 ) -> bool:
@@ -127,7 +134,7 @@ def __new__(cls, keys_by_dimension: Mapping[str, str]):
         )
 
         dimension_keys: list[PartitionDimensionKey] = [
-            PartitionDimensionKey(dimension, keys_by_dimension[dimension])
+            PartitionDimensionKey(_intern_dimension_name(dimension), keys_by_dimension[dimension])
             for dimension in sorted(list(keys_by_dimension.keys()))
         ]
 
@@ -219,7 +226,7 @@ def __new__(
 
         return super().__new__(
             cls,
-            name=check.str_param(name, "name"),
+            name=_intern_dimension_name(check.str_param(name, "name")),
             partitions_def=check.inst_param(partitions_def, "partitions_def", PartitionsDefinition),
         )
 
@@ -25,6 +25,10 @@
     from typing_extensions import Literal
     from upath import UPath
 
+# Protocol written by the default filesystem IO manager. Pinned rather than pickle.HIGHEST_PROTOCOL
+# so files don't depend on the writing interpreter; 5 is readable on every supported Python.
+_FS_PICKLE_PROTOCOL = 5
+
 
 class FilesystemIOManager(ConfigurableIOManagerFactory["PickledObjectFilesystemIOManager"]):
     """Built-in filesystem IO manager that stores and retrieves values using pickling.
@@ -122,6 +126,13 @@ def job():
     """
 
     base_dir: Optional[str] = Field(default=None, description="Base directory for storing files.")
+    pickle_protocol: int = Field(
+        default=_FS_PICKLE_PROTOCOL,
+        description=(
+            "Pickle protocol used when writing files, between 0 and pickle.HIGHEST_PROTOCOL."
+            " Reads detect the protocol."
+        ),
+    )
 
     @classmethod
     def _is_dagster_maintained(cls) -> bool:
@@ -129,7 +140,9 @@ def _is_dagster_maintained(cls) -> bool:
 
     def create_io_manager(self, context: InitResourceContext) -> "PickledObjectFilesystemIOManager":
         base_dir = self.base_dir or check.not_none(context.instance).storage_directory()
-        return PickledObjectFilesystemIOManager(base_dir=base_dir)
+        return PickledObjectFilesystemIOManager(
+            base_dir=base_dir, pickle_protocol=self.pickle_protocol
+        )
 
 
 @dagster_maintained_io_manager
@@ -243,22 +256,30 @@ class PickledObjectFilesystemIOManager(UPathIOManager):
     Args:
         base_dir (Optional[str]): base directory where all the step outputs which use this object
             manager will be stored in.
+        pickle_protocol (int): pickle protocol used when writing step outputs, between 0 and
+            ``pickle.HIGHEST_PROTOCOL``. Defaults to ``_FS_PICKLE_PROTOCOL``.
         **kwargs: additional keyword arguments for `universal_pathlib.UPath`.
     """
 
     extension: str = ""  # TODO: maybe change this to .pickle? Leaving blank for compatibility.  # pyright: ignore[reportIncompatibleVariableOverride]
 
-    def __init__(self, base_dir=None, **kwargs):
+    def __init__(self, base_dir=None, pickle_protocol: int = _FS_PICKLE_PROTOCOL, **kwargs):
         from upath import UPath
 
         self.base_dir = check.opt_str_param(base_dir, "base_dir")
+        self.pickle_protocol = check.int_param(pickle_protocol, "pickle_protocol")
+        check.param_invariant(
+            0 <= self.pickle_protocol <= pickle.HIGHEST_PROTOCOL,
+            "pickle_protocol",
+            f"Must be between 0 and {pickle.HIGHEST_PROTOCOL}, got {self.pickle_protocol}.",
+        )
 
         super().__init__(base_path=UPath(base_dir, **kwargs))
 
     def dump_to_path(self, context: OutputContext, obj: Any, path: "UPath"):
         try:
             with path.open("wb") as file:
-                pickle.dump(obj, file, PICKLE_PROTOCOL)
+                pickle.dump(obj, file, self.pickle_protocol)
         except (AttributeError, RecursionError, ImportError, pickle.PicklingError) as e:
             executor = context.step_context.job_def.executor_def
 
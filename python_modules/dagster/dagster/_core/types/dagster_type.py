@@ -880,6 +880,11 @@ def display_name(self) -> str:
 
 
 def resolve_dagster_type(dagster_type: object) -> DagsterType:
+    # Inputs and outputs without a type annotation are the common case, so resolve them up front
+    # without going through the checks below.
+    if dagster_type is None:
+        return Any
+
     # circular dep
     from dagster._core.definitions.result import MaterializeResult, ObserveResult
     from dagster._core.types.primitive_mapping import (
@@ -951,9 +956,6 @@ def resolve_dagster_type(dagster_type: object) -> DagsterType:
     if is_supported_runtime_python_builtin(dagster_type):
         return remap_python_builtin_for_runtime(dagster_type)
 
-    if dagster_type is None:
-        return Any
-
     if dagster_type is DDict:
         return PythonDict
     if isinstance(dagster_type, DagsterTupleApi):
@@ -198,6 +198,7 @@ def wrap_op_in_graph_and_execute(
     do_input_mapping: bool = True,
     do_output_mapping: bool = True,
     logger_defs: Optional[Mapping[str, LoggerDefinition]] = None,
+    instance: Optional[DagsterInstance] = None,
 ) -> ExecuteInProcessResult:
     """Execute a single op in an ephemeral, in-process job.
 
@@ -220,6 +221,9 @@ def wrap_op_in_graph_and_execute(
             constructed around it.
         do_output_mapping (bool): Whether to map the op outputs to the outputs of the graph
             constructed around it.
+        instance (Optional[DagsterInstance]): The instance to execute against. Passing the same
+            instance across calls avoids setting up a fresh ephemeral instance, and its storage,
+            for every execution. If not provided, an ephemeral instance is used.
 
     Returns:
         Union[CompositeSolidExecutionResult, SolidExecutionResult]: The result of executing the
@@ -235,6 +239,7 @@ def wrap_op_in_graph_and_execute(
             input_values=input_values,
             raise_on_error=raise_on_error,
             run_config=run_config,
+            instance=instance,
         )
     )
 
@@ -1,5 +1,7 @@
-from collections.abc import Mapping, Sequence
-from typing import Any, Optional, Union, cast, overload
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, TypeVar, Union, cast, overload
 
 from typing_extensions import Literal
 
@@ -15,7 +17,8 @@
     DataVersion,
 )
 from dagster._core.definitions.events import AssetKey, AssetMaterialization
-from dagster._core.definitions.materialize import materialize
+from dagster._core.definitions.job_definition import JobDefinition
+from dagster._core.definitions.materialize import _build_ephemeral_asset_job
 from dagster._core.definitions.run_config import RunConfig
 from dagster._core.definitions.source_asset import SourceAsset
 from dagster._core.execution.execute_in_process_result import ExecuteInProcessResult
@@ -23,6 +26,8 @@
 from dagster._core.storage.io_manager import IOManager, io_manager
 from dagster._time import get_current_datetime
 
+T = TypeVar("T")
+
 
 class MaterializationTable:
     def __init__(self, materializations: Mapping[AssetKey, AssetMaterialization]):
@@ -121,6 +126,63 @@ def assert_provenance_no_match(
     assert mat_prov_dv != upstream_mat_dv
 
 
+# Only set inside `reuse_built_definitions`. Entries are keyed by the identity of the passed
+# definitions and hold references to them, so an id in a live key can't be reused by a new object.
+_built_definitions_cache: ContextVar[
+    Optional[dict[tuple[Union[str, int], ...], tuple[tuple[object, ...], Any]]]
+] = ContextVar("_built_definitions_cache", default=None)
+
+
+@contextmanager
+def reuse_built_definitions() -> Iterator[None]:
+    """Within this context, the materialize and stale status helpers reuse the job or asset graph
+    built for a previous call that was passed the same definition objects, instead of building a
+    new one on every call.
+    """
+    token = _built_definitions_cache.set({})
+    try:
+        yield
+    finally:
+        _built_definitions_cache.reset(token)
+
+
+def _get_built(kind: str, key_objs: Sequence[object], build: Callable[[], T]) -> T:
+    cache = _built_definitions_cache.get()
+    if cache is None:
+        return build()
+
+    key = (kind, *(id(obj) for obj in key_objs))
+    if key not in cache:
+        cache[key] = (tuple(key_objs), build())
+    return cache[key][1]
+
+
+def _build_materialize_job(
+    assets: Sequence[Union[AssetsDefinition, SourceAsset]],
+    selection: Optional[CoercibleToAssetSelection] = None,
+) -> JobDefinition:
+    return _build_ephemeral_asset_job(
+        assets, resources={"io_manager": mock_io_manager}, selection=selection
+    )
+
+
+def _build_assets_for_materialize_asset(
+    all_assets: Sequence[Union[AssetsDefinition, SourceAsset]],
+    asset_to_materialize: AssetsDefinition,
+) -> Sequence[Union[AssetsDefinition, SourceAsset]]:
+    assets: list[Union[AssetsDefinition, SourceAsset]] = []
+    for asset_def in all_assets:
+        if isinstance(asset_def, SourceAsset):
+            assets.append(asset_def)
+        else:
+            assert isinstance(asset_def, AssetsDefinition)
+            if asset_def == asset_to_materialize:
+                assets.append(asset_def)
+            else:
+                assets.append(asset_def.to_source_assets()[0])
+    return assets
+
+
 @overload
 def materialize_asset(
     all_assets: Sequence[Union[AssetsDefinition, SourceAsset]],
@@ -158,21 +220,15 @@ def materialize_asset(
     run_config: Optional[Union[RunConfig, Mapping[str, Any]]] = None,
     tags: Optional[Mapping[str, str]] = None,
 ) -> Union[AssetMaterialization, MaterializationTable]:
-    assets: list[Union[AssetsDefinition, SourceAsset]] = []
-    for asset_def in all_assets:
-        if isinstance(asset_def, SourceAsset):
-            assets.append(asset_def)
-        else:
-            assert isinstance(asset_def, AssetsDefinition)
-            if asset_def == asset_to_materialize:
-                assets.append(asset_def)
-            else:
-                assets.append(asset_def.to_source_assets()[0])
-
-    result = materialize(
-        assets,
+    job = _get_built(
+        "materialize_asset",
+        [*all_assets, asset_to_materialize],
+        lambda: _build_materialize_job(
+            _build_assets_for_materialize_asset(all_assets, asset_to_materialize)
+        ),
+    )
+    result = job.execute_in_process(
         instance=instance,
-        resources={"io_manager": mock_io_manager},
         partition_key=partition_key,
         run_config=run_config,
         tags=tags,
@@ -192,14 +248,15 @@ def materialize_assets(
     tags: Optional[Mapping[str, str]] = None,
     selection: Optional[CoercibleToAssetSelection] = None,
 ) -> MaterializationTable:
-    result = materialize(
-        assets,
+    if selection is None:
+        job = _get_built("materialize_assets", assets, lambda: _build_materialize_job(assets))
+    else:
+        job = _build_materialize_job(assets, selection)
+    result = job.execute_in_process(
         instance=instance,
-        resources={"io_manager": mock_io_manager},
         partition_key=partition_key,
         run_config=run_config,
         tags=tags,
-        selection=selection,
     )
     return get_mats_from_result(result, assets)
 
@@ -218,7 +275,7 @@ def get_stale_status_resolver(
     instance: DagsterInstance,
     assets: Sequence[Union[AssetsDefinition, SourceAsset]],
 ) -> CachingStaleStatusResolver:
-    asset_graph = AssetGraph.from_assets(assets)
+    asset_graph = _get_built("asset_graph", assets, lambda: AssetGraph.from_assets(assets))
     asset_graph_view = AssetGraphView(
         temporal_context=TemporalContext(effective_dt=get_current_datetime(), last_event_id=None),
         instance=instance,
@@ -226,6 +283,6 @@ def get_stale_status_resolver(
     )
     return CachingStaleStatusResolver(
         instance=instance,
-        asset_graph=AssetGraph.from_assets(assets),
+        asset_graph=asset_graph,
         loading_context=asset_graph_view,
     )
@@ -21,6 +21,18 @@ def return_default_to_one(context):
     wrap_op_in_graph_and_execute(return_default_to_one)
 
 
+def test_wrap_op_in_graph_and_execute_with_instance():
+    @dg.op(config_schema={"default_to_one": dg.Field(int, default_value=1)})
+    def return_default_to_one(context):
+        return context.op_config["default_to_one"]
+
+    with dg.instance_for_test() as instance:
+        first = wrap_op_in_graph_and_execute(return_default_to_one, instance=instance)
+        second = wrap_op_in_graph_and_execute(return_default_to_one, instance=instance)
+        assert first.output_value() == second.output_value() == 1
+        assert len(instance.get_runs()) == 2
+
+
 def test_scalar_field_defaults():
     assert dg.Field(int).is_required is True
     assert dg.Field(dg.Noneable(int)).is_required is False
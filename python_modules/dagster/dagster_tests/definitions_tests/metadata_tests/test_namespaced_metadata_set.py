@@ -70,3 +70,45 @@ def namespace(cls) -> str:
         match=r"Type annotation for field 'unsupported' includes invalid metadata type\(s\).+MyClass",
     ):
         MyMetadataSet(unsupported=MyClass())
+
+
+def test_splat_after_model_copy():
+    class MyMetadataSet(NamespacedMetadataSet):
+        primitive_int: Optional[int] = None
+        primitive_float: Optional[float] = None
+
+        @classmethod
+        def namespace(cls) -> str:
+            return "foo"
+
+    metadata_set = MyMetadataSet(primitive_int=5)
+    assert dict(metadata_set) == {"foo/primitive_int": 5}
+    assert {**metadata_set} == {"foo/primitive_int": 5}
+    assert metadata_set["foo/primitive_float"] is None
+
+    copied = metadata_set.model_copy(update={"primitive_float": 1.0})
+    assert dict(copied) == {"foo/primitive_int": 5, "foo/primitive_float": 1.0}
+    assert dict(metadata_set) == {"foo/primitive_int": 5}
+
+
+def test_equality_and_hash():
+    class MyMetadataSet(NamespacedMetadataSet):
+        primitive_int: Optional[int] = None
+
+        @classmethod
+        def namespace(cls) -> str:
+            return "foo"
+
+    class MyOtherMetadataSet(NamespacedMetadataSet):
+        primitive_int: Optional[int] = None
+
+        @classmethod
+        def namespace(cls) -> str:
+            return "foo"
+
+    assert MyMetadataSet(primitive_int=5) == MyMetadataSet(primitive_int=5)
+    assert MyMetadataSet(primitive_int=5) != MyMetadataSet(primitive_int=6)
+    assert MyMetadataSet(primitive_int=5) != MyOtherMetadataSet(primitive_int=5)
+    assert MyMetadataSet(primitive_int=5) != {"foo/primitive_int": 5}
+    assert MyMetadataSet(primitive_int=5).__eq__(5) is NotImplemented
+    assert len({MyMetadataSet(primitive_int=5), MyMetadataSet(primitive_int=5)}) == 1
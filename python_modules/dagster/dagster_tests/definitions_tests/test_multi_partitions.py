@@ -12,6 +12,7 @@
     partition_loading_context,
 )
 from dagster._core.definitions.partitions.utils import get_time_partitions_def
+from dagster._core.definitions.partitions.utils.multi import MultiPartitionCursor
 from dagster._core.definitions.temporal_context import TemporalContext
 from dagster._core.storage.tags import get_multidimensional_partition_tag
 from dagster._time import create_datetime
@@ -672,7 +673,15 @@ def test_multipartitions_range_cartesian_multiple_keys_in_both_ranges():
     ]
 
 
-def test_basic_pagination():
+@pytest.fixture(scope="module")
+def partition_context() -> PartitionLoadingContext:
+    return PartitionLoadingContext(
+        temporal_context=TemporalContext(effective_dt=datetime.now(), last_event_id=None),
+        dynamic_partitions_store=None,
+    )
+
+
+def test_basic_pagination(partition_context: PartitionLoadingContext):
     """Test basic pagination works correctly."""
     dimension_a = dg.StaticPartitionsDefinition(["a1", "a2", "a3"])
     dimension_b = dg.StaticPartitionsDefinition(["b1", "b2"])
@@ -680,10 +689,7 @@ def test_basic_pagination():
     multi_partitions = dg.MultiPartitionsDefinition({"dim_a": dimension_a, "dim_b": dimension_b})
 
     paginated_results = multi_partitions.get_paginated_partition_keys(
-        context=PartitionLoadingContext(
-            temporal_context=TemporalContext(effective_dt=datetime.now(), last_event_id=None),
-            dynamic_partitions_store=None,
-        ),
+        context=partition_context,
         limit=3,
         ascending=True,
         cursor=None,
@@ -702,10 +708,7 @@ def test_basic_pagination():
         assert cast("dg.MultiPartitionKey", key).keys_by_dimension == expected_keys[i]
 
     paginated_results2 = multi_partitions.get_paginated_partition_keys(
-        context=PartitionLoadingContext(
-            temporal_context=TemporalContext(effective_dt=datetime.now(), last_event_id=None),
-            dynamic_partitions_store=None,
-        ),
+        context=partition_context,
         limit=3,
         ascending=True,
         cursor=paginated_results.cursor,
@@ -724,7 +727,7 @@ def test_basic_pagination():
         assert cast("dg.MultiPartitionKey", key).keys_by_dimension == expected_keys2[i]
 
 
-def test_reverse_pagination():
+def test_reverse_pagination(partition_context: PartitionLoadingContext):
     """Test reverse pagination works correctly."""
     dimension_a = dg.StaticPartitionsDefinition(["a1", "a2", "a3"])
     dimension_b = dg.StaticPartitionsDefinition(["b1", "b2"])
@@ -732,10 +735,7 @@ def test_reverse_pagination():
     multi_partitions = dg.MultiPartitionsDefinition({"dim_a": dimension_a, "dim_b": dimension_b})
 
     paginated_results = multi_partitions.get_paginated_partition_keys(
-        context=PartitionLoadingContext(
-            temporal_context=TemporalContext(effective_dt=datetime.now(), last_event_id=None),
-            dynamic_partitions_store=None,
-        ),
+        context=partition_context,
         limit=3,
         ascending=False,
         cursor=None,
@@ -753,10 +753,7 @@ def test_reverse_pagination():
         assert cast("dg.MultiPartitionKey", key).keys_by_dimension == expected_keys[i]
 
     paginated_results2 = multi_partitions.get_paginated_partition_keys(
-        context=PartitionLoadingContext(
-            temporal_context=TemporalContext(effective_dt=datetime.now(), last_event_id=None),
-            dynamic_partitions_store=None,
-        ),
+        context=partition_context,
         limit=3,
         ascending=False,
         cursor=paginated_results.cursor,
@@ -775,16 +772,12 @@ def test_reverse_pagination():
         assert cast("dg.MultiPartitionKey", key).keys_by_dimension == expected_keys2[i]
 
 
-def test_pagination_accumulation():
+def test_pagination_accumulation(partition_context: PartitionLoadingContext):
     """Test multiple pagination calls accumulate the full cross product."""
     dimension_a = dg.StaticPartitionsDefinition(["a1", "a2", "a3", "a4"])
     dimension_b = dg.StaticPartitionsDefinition(["b1", "b2", "b3", "b4", "b5"])
 
     multi_partitions = dg.MultiPartitionsDefinition({"dim_a": dimension_a, "dim_b": dimension_b})
-    partition_context = PartitionLoadingContext(
-        temporal_context=TemporalContext(effective_dt=datetime.now(), last_event_id=None),
-        dynamic_partitions_store=None,
-    )
 
     all_results = []
     cursor = None
@@ -830,19 +823,48 @@ def test_pagination_accumulation():
         has_more = paginated_results.has_more
 
     assert len(reverse_results) == 20
-    assert reverse_results == [str(key) for key in reversed(all_results)]
+    assert reverse_results == list(reversed(all_results))
+
 
+def test_reverse_pagination_is_keyset(partition_context: PartitionLoadingContext):
+    """Test that pagination cursors encode the last key emitted rather than an offset."""
+    dimension_a = dg.StaticPartitionsDefinition(["a1", "a2", "a3", "a4"])
+    dimension_b = dg.StaticPartitionsDefinition(["b1", "b2", "b3", "b4", "b5"])
 
-def test_empty_dimension():
+    multi_partitions = dg.MultiPartitionsDefinition({"dim_a": dimension_a, "dim_b": dimension_b})
+
+    reverse_results = []
+    cursor = None
+    has_more = True
+    with mock.patch.object(
+        multi_partitions,
+        "get_partition_keys",
+        side_effect=Exception("pagination should not materialize the full cross product"),
+    ):
+        while has_more:
+            paginated_results = multi_partitions.get_paginated_partition_keys(
+                context=partition_context,
+                ascending=False,
+                cursor=cursor,
+                limit=4,
+            )
+            reverse_results.extend(paginated_results.results)
+            cursor = paginated_results.cursor
+            has_more = paginated_results.has_more
+
+            last_seen_key = MultiPartitionCursor.from_cursor(cursor).last_seen_key
+            assert last_seen_key == paginated_results.results[-1]
+
+    assert len(reverse_results) == 20
+    assert reverse_results[-1].keys_by_dimension == {"dim_a": "a1", "dim_b": "b1"}
+
+
+def test_empty_dimension(partition_context: PartitionLoadingContext):
     """Test behavior when one dimension is empty."""
     dimension_a = dg.StaticPartitionsDefinition(["a1", "a2"])
     dimension_b = dg.StaticPartitionsDefinition([])  # Empty dimension
 
     multi_partitions = dg.MultiPartitionsDefinition({"dim_a": dimension_a, "dim_b": dimension_b})
-    partition_context = PartitionLoadingContext(
-        temporal_context=TemporalContext(effective_dt=datetime.now(), last_event_id=None),
-        dynamic_partitions_store=None,
-    )
     paginated_results = multi_partitions.get_paginated_partition_keys(
         context=partition_context,
         ascending=True,
@@ -853,7 +875,7 @@ def test_empty_dimension():
     assert not paginated_results.has_more
 
 
-def test_large_cross_product_memory_usage():
+def test_large_cross_product_memory_usage(partition_context: PartitionLoadingContext):
     """Test memory efficiency with large dimensions."""
     large_dimension_a = dg.StaticPartitionsDefinition([f"a{i}" for i in range(1000)])
     large_dimension_b = dg.StaticPartitionsDefinition([f"b{i}" for i in range(1000)])
@@ -861,14 +883,16 @@ def test_large_cross_product_memory_usage():
     multi_partitions = dg.MultiPartitionsDefinition(
         {"dim_a": large_dimension_a, "dim_b": large_dimension_b}
     )
-    partition_context = PartitionLoadingContext(
-        temporal_context=TemporalContext(effective_dt=datetime.now(), last_event_id=None),
-        dynamic_partitions_store=None,
-    )
 
     with (
         mock.patch("itertools.product") as mock_product,
         mock.patch.object(multi_partitions, "get_partition_keys") as mock_get_partition_keys,
+        mock.patch.object(
+            dg.StaticPartitionsDefinition,
+            "get_partition_keys",
+            autospec=True,
+            side_effect=dg.StaticPartitionsDefinition.get_partition_keys,
+        ) as mock_get_dimension_keys,
     ):
         paginated_results = multi_partitions.get_paginated_partition_keys(
             context=partition_context,
@@ -882,6 +906,8 @@ def test_large_cross_product_memory_usage():
         assert paginated_results.has_more
         mock_product.assert_not_called()
         mock_get_partition_keys.assert_not_called()
+        # each dimension's keys are fetched once, rather than once per key in the cross product
+        assert mock_get_dimension_keys.call_count == 2
 
 
 @pytest.mark.parametrize(
@@ -893,6 +919,9 @@ def test_large_cross_product_memory_usage():
         ("a|b", False),
         ("abc", False),
         ("super1@#^k-INVALID", False),
+        ("a|2|3", False),
+        ("a|", False),
+        ("", False),
     ],
 )
 def test_has_partition_key(key: str, expected: bool) -> None:
@@ -901,3 +930,5 @@ def test_has_partition_key(key: str, expected: bool) -> None:
 
     multi_partitions = dg.MultiPartitionsDefinition({"dim1": dim1, "dim2": dim2})
     assert multi_partitions.has_partition_key(key) == expected
+    if expected:
+        assert multi_partitions.has_partition_key(multi_partitions.get_partition_key_from_str(key))
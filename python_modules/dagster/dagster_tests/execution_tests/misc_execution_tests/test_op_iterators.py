@@ -1,68 +1,64 @@
 import dagster as dg
+import pytest
 from dagster._annotations import beta
 from dagster._utils.test import wrap_op_in_graph_and_execute
 
 
-def test_generator_return_op():
-    def _gen():
-        yield dg.Output("done")
+@pytest.fixture(scope="module")
+def instance():
+    with dg.instance_for_test() as instance:
+        yield instance
 
-    @dg.op
-    def gen_ret_op(_):
-        return _gen()
 
-    result = wrap_op_in_graph_and_execute(gen_ret_op)
-    assert result.output_value() == "done"
+def _gen():
+    yield dg.Output("done")
+
+
+@dg.op
+def gen_ret_op(_):
+    return _gen()
 
 
-def test_generator_yield_op():
-    def _gen():
-        yield dg.Output("done")
+@dg.op
+def gen_yield_op(_):
+    yield from _gen()
 
-    @dg.op
-    def gen_yield_op(_):
-        yield from _gen()
 
-    result = wrap_op_in_graph_and_execute(gen_yield_op)
+@pytest.mark.parametrize("op_def", [gen_ret_op, gen_yield_op], ids=["return", "yield_from"])
+def test_generator_op(instance, op_def: dg.OpDefinition):
+    result = wrap_op_in_graph_and_execute(op_def, instance=instance)
     assert result.output_value() == "done"
 
 
-def test_generator_yield_from_op():
-    def _gen():
-        yield dg.Output("done")
+def _nested_gen1():
+    yield dg.AssetMaterialization("test")
 
-    @dg.op
-    def gen_yield_op(_):
-        yield from _gen()
 
-    result = wrap_op_in_graph_and_execute(gen_yield_op)
-    assert result.output_value() == "done"
+def _nested_gen2():
+    yield dg.Output("done")
 
 
-def test_nested_generator_op():
-    def _gen1():
-        yield dg.AssetMaterialization("test")
+def _nested_gen():
+    yield from _nested_gen1()
+    yield from _nested_gen2()
 
-    def _gen2():
-        yield dg.Output("done")
 
-    def _gen():
-        yield from _gen1()
-        yield from _gen2()
+@dg.op
+def gen_return_op(_):
+    return _nested_gen()
 
-    @dg.op
-    def gen_return_op(_):
-        return _gen()
 
-    result = wrap_op_in_graph_and_execute(gen_return_op)
+def test_nested_generator_op(instance):
+    result = wrap_op_in_graph_and_execute(gen_return_op, instance=instance)
     assert result.output_value() == "done"
 
 
-def test_beta_generator_op():
-    @dg.op
-    @beta
-    def gen_op():
-        yield dg.Output("done")
+@dg.op
+@beta
+def gen_op():
+    yield dg.Output("done")
+
 
-    result = wrap_op_in_graph_and_execute(gen_op)
+def test_beta_generator_op(instance):
+    result = wrap_op_in_graph_and_execute(gen_op, instance=instance)
     assert result.output_value() == "done"
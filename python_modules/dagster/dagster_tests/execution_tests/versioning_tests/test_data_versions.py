@@ -1,14 +1,12 @@
-import re
+from collections.abc import Sequence
 from datetime import datetime, timedelta
-from random import randint
+from typing import Optional, Union
 from unittest import mock
 
 import dagster as dg
 import pytest
-from dagster import DagsterInstance
 from dagster._core.definitions.data_version import (
     DATA_VERSION_TAG,
-    SKIP_PARTITION_DATA_VERSION_DEPENDENCY_THRESHOLD,
     StaleCause,
     StaleCauseCategory,
     StaleStatus,
@@ -37,71 +35,96 @@
     materialize_asset,
     materialize_assets,
     materialize_twice,
+    reuse_built_definitions,
 )
 
 from dagster_tests.core_tests.instance_tests.test_instance_data_versions import (
     create_test_event_log_entry,
 )
 
-# ########################
-# ##### TESTS
-# ########################
 
+@pytest.fixture(scope="module")
+def shared_instance():
+    with dg.instance_for_test() as instance:
+        yield instance
 
-def test_single_asset():
-    @dg.asset
-    def asset1(): ...
-
-    instance = DagsterInstance.ephemeral()
-    mat1, mat2 = materialize_twice([asset1], asset1, instance)
-    assert_different_versions(mat1, mat2)
 
+@pytest.fixture
+def instance(shared_instance):
+    # Reuse one instance across the module; wipe between tests so each starts from an empty
+    # event log and run storage.
+    yield shared_instance
+    shared_instance.wipe()
 
-def test_single_versioned_asset():
-    @dg.asset(code_version="abc")
-    def asset1(): ...
 
-    instance = DagsterInstance.ephemeral()
-    mat1, mat2 = materialize_twice([asset1], asset1, instance)
-    assert_same_versions(mat1, mat2, "abc")
+@pytest.fixture(scope="module", autouse=True)
+def built_definitions():
+    # Tests materialize and resolve stale status for the same asset lists many times; build each
+    # job and asset graph only once.
+    with reuse_built_definitions():
+        yield
 
 
-def test_source_asset_non_versioned_asset():
-    source1 = dg.SourceAsset("source1")
+# ########################
+# ##### TESTS
+# ########################
 
-    @dg.asset
-    def asset1(source1): ...
 
-    instance = DagsterInstance.ephemeral()
-    mat1, mat2 = materialize_twice([source1, asset1], asset1, instance)
-    assert_different_versions(mat1, mat2)
+source1 = dg.SourceAsset("source1")
 
 
-def test_source_asset_versioned_asset():
-    source1 = dg.SourceAsset("source1")
+@dg.asset(name="asset1")
+def unversioned_asset(): ...
 
-    @dg.asset(code_version="abc")
-    def asset1(source1): ...
 
-    instance = DagsterInstance.ephemeral()
+@dg.asset(name="asset1", code_version="abc")
+def versioned_asset(): ...
 
-    mat1, mat2 = materialize_twice([source1, asset1], asset1, instance)
-    assert_same_versions(mat1, mat2, "abc")
 
+@dg.asset(name="asset1")
+def unversioned_asset_with_source_input(source1): ...
 
-def test_source_asset_non_versioned_asset_deps():
-    source1 = dg.SourceAsset("source1")
 
-    @dg.asset(deps=[source1])
-    def asset1(): ...
+@dg.asset(name="asset1", code_version="abc")
+def versioned_asset_with_source_input(source1): ...
 
-    instance = DagsterInstance.ephemeral()
 
-    mat1, mat2 = materialize_twice([source1, asset1], asset1, instance)
-    assert_different_versions(mat1, mat2)
+@dg.asset(name="asset1", deps=[source1])
+def unversioned_asset_with_source_dep(): ...
 
 
-def test_versioned_after_unversioned():
+@pytest.mark.parametrize(
+    "all_assets, code_version",
+    [
+        ([unversioned_asset], None),
+        ([versioned_asset], "abc"),
+        ([source1, unversioned_asset_with_source_input], None),
+        ([source1, versioned_asset_with_source_input], "abc"),
+        ([source1, unversioned_asset_with_source_dep], None),
+    ],
+    ids=[
+        "single_asset",
+        "single_versioned_asset",
+        "source_asset_non_versioned_asset",
+        "source_asset_versioned_asset",
+        "source_asset_non_versioned_asset_deps",
+    ],
+)
+def test_materialize_twice(
+    instance,
+    all_assets: Sequence[Union[dg.AssetsDefinition, dg.SourceAsset]],
+    code_version: Optional[str],
+):
+    asset1 = all_assets[-1]
+    assert isinstance(asset1, dg.AssetsDefinition)
+    mat1, mat2 = materialize_twice(all_assets, asset1, instance)
+    if code_version:
+        assert_same_versions(mat1, mat2, code_version)
+    else:
+        assert_different_versions(mat1, mat2)
+
+
+def test_versioned_after_unversioned(instance):
     source1 = dg.SourceAsset("source1")
 
     @dg.asset
@@ -111,7 +134,6 @@ def asset1(source1): ...
     def asset2(asset1): ...
 
     all_assets = [source1, asset1, asset2]
-    instance = DagsterInstance.ephemeral()
 
     asset2_mat1 = materialize_assets(all_assets, instance)[asset2.key]
     asset2_mat2 = materialize_asset(all_assets, asset2, instance)
@@ -123,7 +145,7 @@ def asset2(asset1): ...
     assert_different_versions(asset2_mat2, asset2_mat3)
 
 
-def test_versioned_after_versioned():
+def test_versioned_after_versioned(instance):
     source1 = dg.SourceAsset("source1")
 
     @dg.asset(code_version="abc")
@@ -133,7 +155,6 @@ def asset1(source1): ...
     def asset2(asset1): ...
 
     all_assets = [source1, asset1, asset2]
-    instance = DagsterInstance.ephemeral()
 
     asset2_mat1 = materialize_assets(all_assets, instance)[asset2.key]
     asset2_mat2 = materialize_assets(all_assets, instance)[asset2.key]
@@ -143,7 +164,7 @@ def asset2(asset1): ...
     assert_same_versions(asset2_mat1, asset2_mat3, "xyz")
 
 
-def test_unversioned_after_versioned():
+def test_unversioned_after_versioned(instance):
     source1 = dg.SourceAsset("source1")
 
     @dg.asset(code_version="abc")
@@ -153,7 +174,6 @@ def asset1(source1): ...
     def asset2(asset1): ...
 
     all_assets = [source1, asset1, asset2]
-    instance = DagsterInstance.ephemeral()
 
     asset2_mat1 = materialize_assets(all_assets, instance)[asset2.key]
     asset2_mat2 = materialize_asset(all_assets, asset2, instance)
@@ -161,7 +181,7 @@ def asset2(asset1): ...
     assert_different_versions(asset2_mat1, asset2_mat2)
 
 
-def test_multi_asset():
+def test_multi_asset(instance):
     @dg.asset
     def start():
         return 1
@@ -188,7 +208,6 @@ def abc_(context, start):
         for output_name in outputs_to_return:
             yield dg.Output(out_values[output_name], output_name)
 
-    instance = DagsterInstance.ephemeral()
     mats_1 = materialize_assets([start, abc_], instance)
     mat_a_1 = mats_1[dg.AssetKey("a")]
     mats_2 = materialize_asset([start, abc_], abc_, instance, is_multi=True)
@@ -198,7 +217,7 @@ def abc_(context, start):
     assert_provenance_no_match(mat_b_2, mat_a_1)
 
 
-def test_multiple_code_versions():
+def test_multiple_code_versions(instance):
     @dg.multi_asset(
         outs={
             "alpha": dg.AssetOut(code_version="a"),
@@ -209,7 +228,7 @@ def alpha_beta():
         yield dg.Output(1, "alpha")
         yield dg.Output(2, "beta")
 
-    mats = materialize_assets([alpha_beta], DagsterInstance.ephemeral())
+    mats = materialize_assets([alpha_beta], instance)
     alpha_mat = mats[dg.AssetKey("alpha")]
     beta_mat = mats[dg.AssetKey("beta")]
 
@@ -219,9 +238,7 @@ def alpha_beta():
     assert_code_version(beta_mat, "b")
 
 
-def test_set_data_version_inside_op():
-    instance = DagsterInstance.ephemeral()
-
+def test_set_data_version_inside_op(instance):
     @dg.asset
     def asset1():
         return dg.Output(1, data_version=dg.DataVersion("foo"))
@@ -230,7 +247,8 @@ def asset1():
     assert_data_version(mat, dg.DataVersion("foo"))
 
 
-def test_stale_status_general() -> None:
+def _make_counting_source() -> dg.SourceAsset:
+    """Observable source asset "source1" whose data version increments with each observation."""
     x = 0
 
     @dg.observable_source_asset
@@ -239,6 +257,12 @@ def source1(_context):
         x = x + 1
         return dg.DataVersion(str(x))
 
+    return source1
+
+
+def test_stale_status_general(instance) -> None:
+    source1 = _make_counting_source()
+
     @dg.asset(code_version="abc")
     def asset1(source1): ...
 
@@ -246,77 +270,76 @@ def asset1(source1): ...
     def asset2(asset1): ...
 
     all_assets = [source1, asset1, asset2]
-    with dg.instance_for_test() as instance:
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(source1.key) == StaleStatus.FRESH
-        assert status_resolver.get_status(asset1.key) == StaleStatus.MISSING
-        assert status_resolver.get_status(asset2.key) == StaleStatus.MISSING
-        assert status_resolver.get_stale_causes(source1.key) == []
-        assert status_resolver.get_stale_causes(asset1.key) == []
-        assert status_resolver.get_stale_causes(asset2.key) == []
-
-        materialize_assets(all_assets, instance)
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(source1.key) == StaleStatus.FRESH
+    assert status_resolver.get_status(asset1.key) == StaleStatus.MISSING
+    assert status_resolver.get_status(asset2.key) == StaleStatus.MISSING
+    assert status_resolver.get_stale_causes(source1.key) == []
+    assert status_resolver.get_stale_causes(asset1.key) == []
+    assert status_resolver.get_stale_causes(asset2.key) == []
+
+    materialize_assets(all_assets, instance)
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
+
+    observe([source1], instance=instance)
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key) == StaleStatus.STALE
+    assert status_resolver.get_stale_causes(asset1.key) == [
+        StaleCause(
+            asset1.key,
+            StaleCauseCategory.DATA,
+            "has a new dependency data version",
+            source1.key,
+            [
+                StaleCause(source1.key, StaleCauseCategory.DATA, "has a new data version"),
+            ],
+        ),
+    ]
+    assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
+    materialize_assets(all_assets, instance)
+
+    # Simulate updating an asset with a new code version
+    @dg.asset(name="asset1", code_version="def")
+    def asset1_v2(source1): ...
+
+    all_assets_v2 = [source1, asset1_v2, asset2]
+
+    status_resolver = get_stale_status_resolver(instance, all_assets_v2)
+    assert status_resolver.get_status(asset1.key) == StaleStatus.STALE
+    assert status_resolver.get_stale_causes(asset1.key) == [
+        StaleCause(asset1.key, StaleCauseCategory.CODE, "has a new code version"),
+    ]
+    assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
 
-        observe([source1], instance=instance)
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key) == StaleStatus.STALE
-        assert status_resolver.get_stale_causes(asset1.key) == [
-            StaleCause(
-                asset1.key,
-                StaleCauseCategory.DATA,
-                "has a new dependency data version",
-                source1.key,
-                [
-                    StaleCause(source1.key, StaleCauseCategory.DATA, "has a new data version"),
-                ],
-            ),
-        ]
-        assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
-        materialize_assets(all_assets, instance)
-
-        # Simulate updating an asset with a new code version
-        @dg.asset(name="asset1", code_version="def")
-        def asset1_v2(source1): ...
-
-        all_assets_v2 = [source1, asset1_v2, asset2]
-
-        status_resolver = get_stale_status_resolver(instance, all_assets_v2)
-        assert status_resolver.get_status(asset1.key) == StaleStatus.STALE
-        assert status_resolver.get_stale_causes(asset1.key) == [
-            StaleCause(asset1.key, StaleCauseCategory.CODE, "has a new code version"),
-        ]
-        assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
-
-        @dg.asset
-        def asset3(): ...
-
-        @dg.asset(name="asset2", code_version="xyz")
-        def asset2_v2(asset3): ...
-
-        all_assets_v3 = [source1, asset1_v2, asset2_v2, asset3]
-
-        status_resolver = get_stale_status_resolver(instance, all_assets_v3)
-        assert status_resolver.get_status(asset2.key) == StaleStatus.STALE
-        assert status_resolver.get_stale_causes(asset2.key) == [
-            StaleCause(
-                asset2.key,
-                StaleCauseCategory.DEPENDENCIES,
-                "removed dependency on asset1",
-                asset1.key,
-            ),
-            StaleCause(
-                asset2.key,
-                StaleCauseCategory.DEPENDENCIES,
-                "has a new dependency on asset3",
-                asset3.key,
-            ),
-        ]
-
-
-def test_stale_status_no_code_versions() -> None:
+    @dg.asset
+    def asset3(): ...
+
+    @dg.asset(name="asset2", code_version="xyz")
+    def asset2_v2(asset3): ...
+
+    all_assets_v3 = [source1, asset1_v2, asset2_v2, asset3]
+
+    status_resolver = get_stale_status_resolver(instance, all_assets_v3)
+    assert status_resolver.get_status(asset2.key) == StaleStatus.STALE
+    assert status_resolver.get_stale_causes(asset2.key) == [
+        StaleCause(
+            asset2.key,
+            StaleCauseCategory.DEPENDENCIES,
+            "removed dependency on asset1",
+            asset1.key,
+        ),
+        StaleCause(
+            asset2.key,
+            StaleCauseCategory.DEPENDENCIES,
+            "has a new dependency on asset3",
+            asset3.key,
+        ),
+    ]
+
+
+def test_stale_status_no_code_versions(instance) -> None:
     @dg.asset
     def asset1(): ...
 
@@ -324,39 +347,38 @@ def asset1(): ...
     def asset2(asset1): ...
 
     all_assets = [asset1, asset2]
-    with dg.instance_for_test() as instance:
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key) == StaleStatus.MISSING
-        assert status_resolver.get_status(asset2.key) == StaleStatus.MISSING
-
-        materialize_assets(all_assets, instance)
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
-
-        materialize_asset(all_assets, asset1, instance)
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key) == StaleStatus.STALE
-        assert status_resolver.get_stale_causes(asset2.key) == [
-            StaleCause(
-                asset2.key,
-                StaleCauseCategory.DATA,
-                "has a new dependency materialization",
-                asset1.key,
-                [
-                    StaleCause(asset1.key, StaleCauseCategory.DATA, "has a new materialization"),
-                ],
-            ),
-        ]
-
-        materialize_asset(all_assets, asset2, instance)
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key) == StaleStatus.MISSING
+    assert status_resolver.get_status(asset2.key) == StaleStatus.MISSING
 
+    materialize_assets(all_assets, instance)
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
 
-def test_stale_status_redundant_upstream_materialization() -> None:
+    materialize_asset(all_assets, asset1, instance)
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key) == StaleStatus.STALE
+    assert status_resolver.get_stale_causes(asset2.key) == [
+        StaleCause(
+            asset2.key,
+            StaleCauseCategory.DATA,
+            "has a new dependency materialization",
+            asset1.key,
+            [
+                StaleCause(asset1.key, StaleCauseCategory.DATA, "has a new materialization"),
+            ],
+        ),
+    ]
+
+    materialize_asset(all_assets, asset2, instance)
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
+
+
+def test_stale_status_redundant_upstream_materialization(instance) -> None:
     @dg.asset(code_version="abc")
     def asset1(): ...
 
@@ -364,31 +386,37 @@ def asset1(): ...
     def asset2(asset1): ...
 
     all_assets = [asset1, asset2]
-    with dg.instance_for_test() as instance:
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key) == StaleStatus.MISSING
-        assert status_resolver.get_status(asset2.key) == StaleStatus.MISSING
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key) == StaleStatus.MISSING
+    assert status_resolver.get_status(asset2.key) == StaleStatus.MISSING
 
-        materialize_assets(all_assets, instance)
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
+    materialize_assets(all_assets, instance)
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
 
-        materialize_asset(all_assets, asset1, instance)
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
+    materialize_asset(all_assets, asset1, instance)
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
 
 
-def test_stale_status_dependency_partitions_count_over_threshold() -> None:
-    partitions_def = dg.StaticPartitionsDefinition(
-        [str(x) for x in range(SKIP_PARTITION_DATA_VERSION_DEPENDENCY_THRESHOLD)]
-    )
+# Lower the threshold so the over-threshold branch is reachable with a handful of partitions. It is
+# read both when recording provenance during execution and when resolving stale status.
+@mock.patch(
+    "dagster._core.execution.context.data_version_cache.SKIP_PARTITION_DATA_VERSION_DEPENDENCY_THRESHOLD",
+    3,
+)
+@mock.patch(
+    "dagster._core.definitions.data_version.SKIP_PARTITION_DATA_VERSION_DEPENDENCY_THRESHOLD", 3
+)
+def test_stale_status_dependency_partitions_count_over_threshold(instance) -> None:
+    partitions_def = dg.StaticPartitionsDefinition([str(x) for x in range(3)])
 
     @dg.asset(partitions_def=partitions_def)
     def asset1(context):
         keys = partitions_def.get_partition_keys_in_range(context.asset_partition_key_range)
-        return {key: randint(0, 100) for key in keys}
+        return dict.fromkeys(keys, 1)
 
     @dg.asset
     def asset2(asset1): ...
@@ -397,40 +425,37 @@ def asset2(asset1): ...
     def asset3(asset1): ...
 
     all_assets = [asset1, asset2, asset3]
-    with dg.instance_for_test() as instance:
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key, "0") == StaleStatus.MISSING
-        assert status_resolver.get_status(asset2.key) == StaleStatus.MISSING
-        assert status_resolver.get_status(asset3.key) == StaleStatus.MISSING
-
-        materialize_assets(
-            [asset1, asset2],
-            tags={
-                ASSET_PARTITION_RANGE_START_TAG: "0",
-                ASSET_PARTITION_RANGE_END_TAG: str(
-                    SKIP_PARTITION_DATA_VERSION_DEPENDENCY_THRESHOLD - 1
-                ),
-            },
-            instance=instance,
-        )
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key, "0") == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
-        assert status_resolver.get_status(asset3.key) == StaleStatus.MISSING
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key, "0") == StaleStatus.MISSING
+    assert status_resolver.get_status(asset2.key) == StaleStatus.MISSING
+    assert status_resolver.get_status(asset3.key) == StaleStatus.MISSING
 
-        materialize_asset(all_assets, asset3, instance)
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset3.key) == StaleStatus.FRESH
+    materialize_assets(
+        [asset1, asset2],
+        tags={
+            ASSET_PARTITION_RANGE_START_TAG: "0",
+            ASSET_PARTITION_RANGE_END_TAG: "2",
+        },
+        instance=instance,
+    )
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key, "0") == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
+    assert status_resolver.get_status(asset3.key) == StaleStatus.MISSING
 
-        # Downstream values are not stale even after upstream changed because we are over threshold
-        materialize_asset(all_assets, asset1, instance, partition_key="0")
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key, "0") == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
-        assert status_resolver.get_status(asset3.key) == StaleStatus.FRESH
+    materialize_asset(all_assets, asset3, instance)
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset3.key) == StaleStatus.FRESH
+
+    # Downstream values are not stale even after upstream changed because we are over threshold
+    materialize_asset(all_assets, asset1, instance, partition_key="0")
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key, "0") == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
+    assert status_resolver.get_status(asset3.key) == StaleStatus.FRESH
 
 
-def test_stale_status_partitions_disabled_code_versions() -> None:
+def test_stale_status_partitions_disabled_code_versions(instance) -> None:
     partitions_def = dg.StaticPartitionsDefinition(["foo"])
 
     @dg.asset(code_version="1", partitions_def=partitions_def)
@@ -440,22 +465,21 @@ def asset1(): ...
     def asset2(asset1): ...
 
     all_assets = [asset1, asset2]
-    with dg.instance_for_test() as instance:
-        materialize_assets([asset1, asset2], partition_key="foo", instance=instance)
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key, "foo") == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key, "foo") == StaleStatus.FRESH
+    materialize_assets([asset1, asset2], partition_key="foo", instance=instance)
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key, "foo") == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key, "foo") == StaleStatus.FRESH
 
-        @dg.asset(code_version="2", partitions_def=partitions_def)
-        def asset1(): ...
+    @dg.asset(code_version="2", partitions_def=partitions_def)
+    def asset1(): ...
 
-        all_assets = [asset1, asset2]
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key, "foo") == StaleStatus.STALE
-        assert status_resolver.get_status(asset2.key, "foo") == StaleStatus.FRESH
+    all_assets = [asset1, asset2]
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key, "foo") == StaleStatus.STALE
+    assert status_resolver.get_status(asset2.key, "foo") == StaleStatus.FRESH
 
 
-def test_stale_status_partitions_enabled() -> None:
+def test_stale_status_partitions_enabled(instance) -> None:
     partitions_def = dg.StaticPartitionsDefinition(["foo"])
 
     class AssetConfig(dg.Config):
@@ -472,53 +496,53 @@ def asset2(asset1): ...
     def asset3(asset1): ...
 
     all_assets = [asset1, asset2, asset3]
-    with dg.instance_for_test() as instance:
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key, "foo") == StaleStatus.MISSING
-        assert status_resolver.get_status(asset2.key, "foo") == StaleStatus.MISSING
-        assert status_resolver.get_status(asset3.key) == StaleStatus.MISSING
-
-        materialize_assets([asset1, asset2], partition_key="foo", instance=instance)
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key, "foo") == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key, "foo") == StaleStatus.FRESH
-        assert status_resolver.get_status(asset3.key) == StaleStatus.MISSING
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key, "foo") == StaleStatus.MISSING
+    assert status_resolver.get_status(asset2.key, "foo") == StaleStatus.MISSING
+    assert status_resolver.get_status(asset3.key) == StaleStatus.MISSING
+
+    materialize_assets([asset1, asset2], partition_key="foo", instance=instance)
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key, "foo") == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key, "foo") == StaleStatus.FRESH
+    assert status_resolver.get_status(asset3.key) == StaleStatus.MISSING
+
+    materialize_asset(all_assets, asset3, instance)
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset3.key) == StaleStatus.FRESH
+
+    # Downstream values are not stale after upstream rematerialized with same version
+    materialize_asset(
+        all_assets,
+        asset1,
+        instance,
+        partition_key="foo",
+        run_config=dg.RunConfig({"asset1": AssetConfig(value=1)}),
+    )
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key, "foo") == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key, "foo") == StaleStatus.FRESH
+    assert status_resolver.get_status(asset3.key) == StaleStatus.FRESH
 
-        materialize_asset(all_assets, asset3, instance)
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset3.key) == StaleStatus.FRESH
-
-        # Downstream values are not stale after upstream rematerialized with same version
-        materialize_asset(
-            all_assets,
-            asset1,
-            instance,
-            partition_key="foo",
-            run_config=dg.RunConfig({"asset1": AssetConfig(value=1)}),
-        )
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key, "foo") == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key, "foo") == StaleStatus.FRESH
-        assert status_resolver.get_status(asset3.key) == StaleStatus.FRESH
-
-        # Downstream values are not stale after upstream rematerialized with same version
-        materialize_asset(
-            all_assets,
-            asset1,
-            instance,
-            partition_key="foo",
-            run_config=dg.RunConfig({"asset1": AssetConfig(value=2)}),
-        )
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key, "foo") == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key, "foo") == StaleStatus.STALE
-        assert status_resolver.get_status(asset3.key) == StaleStatus.STALE
+    # Downstream values are not stale after upstream rematerialized with same version
+    materialize_asset(
+        all_assets,
+        asset1,
+        instance,
+        partition_key="foo",
+        run_config=dg.RunConfig({"asset1": AssetConfig(value=2)}),
+    )
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key, "foo") == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key, "foo") == StaleStatus.STALE
+    assert status_resolver.get_status(asset3.key) == StaleStatus.STALE
 
 
-def test_stale_status_downstream_of_all_partitions_mapping():
+def test_stale_status_downstream_of_all_partitions_mapping(instance):
     start_date = datetime(2020, 1, 1)
     end_date = start_date + timedelta(days=2)
     start_key = start_date.strftime("%Y-%m-%d")
+    end_key = (end_date - timedelta(days=1)).strftime("%Y-%m-%d")
 
     partitions_def = dg.DailyPartitionsDefinition(start_date=start_date, end_date=end_date)
 
@@ -535,32 +559,35 @@ def asset2(asset1):
     all_assets = [asset1, asset2]
 
     # Downstream values are not stale even after upstream changed because of the partition mapping
-    with dg.instance_for_test() as instance:
-        for k in partitions_def.get_partition_keys():
-            materialize_asset(all_assets, asset1, instance, partition_key=k)
+    materialize_asset(
+        all_assets,
+        asset1,
+        instance,
+        tags={ASSET_PARTITION_RANGE_START_TAG: start_key, ASSET_PARTITION_RANGE_END_TAG: end_key},
+    )
 
-        materialize_asset(all_assets, asset2, instance)
+    materialize_asset(all_assets, asset2, instance)
 
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        for k in partitions_def.get_partition_keys():
-            assert status_resolver.get_status(asset1.key, k) == StaleStatus.FRESH
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    for k in (start_key, end_key):
+        assert status_resolver.get_status(asset1.key, k) == StaleStatus.FRESH
 
-        assert status_resolver.get_status(asset2.key, None) == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key, None) == StaleStatus.FRESH
 
-        materialize_asset(
-            all_assets,
-            asset1,
-            instance,
-            partition_key=start_key,
-        )
+    materialize_asset(
+        all_assets,
+        asset1,
+        instance,
+        partition_key=start_key,
+    )
 
-        status_resolver = get_stale_status_resolver(instance, all_assets)
+    status_resolver = get_stale_status_resolver(instance, all_assets)
 
-        # Still fresh b/c of the partition mapping
-        assert status_resolver.get_status(asset2.key, None) == StaleStatus.FRESH
+    # Still fresh b/c of the partition mapping
+    assert status_resolver.get_status(asset2.key, None) == StaleStatus.FRESH
 
 
-def test_stale_status_many_to_one_partitions() -> None:
+def test_stale_status_many_to_one_partitions(instance) -> None:
     partitions_def = dg.StaticPartitionsDefinition(["alpha", "beta"])
 
     class AssetConfig(dg.Config):
@@ -581,98 +608,88 @@ def asset3(asset2):
     a1_beta_key = AssetKeyPartitionKey(asset1.key, "beta")
 
     all_assets = [asset1, asset2, asset3]
-    with dg.instance_for_test() as instance:
-        for key in partitions_def.get_partition_keys():
-            materialize_asset(
-                all_assets,
-                asset1,
-                instance,
-                partition_key=key,
-            )
-        materialize_asset(all_assets, asset2, instance)
+    materialize_asset(
+        all_assets,
+        asset1,
+        instance,
+        tags={ASSET_PARTITION_RANGE_START_TAG: "alpha", ASSET_PARTITION_RANGE_END_TAG: "beta"},
+    )
+    materialize_asset(all_assets, asset2, instance)
 
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key, "alpha") == StaleStatus.FRESH
-        assert status_resolver.get_status(asset1.key, "beta") == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
-        assert status_resolver.get_status(asset3.key, "alpha") == StaleStatus.MISSING
-
-        for key in partitions_def.get_partition_keys():
-            materialize_asset(
-                all_assets,
-                asset3,
-                instance,
-                partition_key=key,
-            )
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset3.key, "alpha") == StaleStatus.FRESH
-        assert status_resolver.get_status(asset3.key, "beta") == StaleStatus.FRESH
-
-        materialize_asset(
-            all_assets,
-            asset1,
-            instance,
-            partition_key="alpha",
-            run_config=dg.RunConfig({"asset1": AssetConfig(value=2)}),
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key, "alpha") == StaleStatus.FRESH
+    assert status_resolver.get_status(asset1.key, "beta") == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
+    assert status_resolver.get_status(asset3.key, "alpha") == StaleStatus.MISSING
+
+    materialize_asset(
+        all_assets,
+        asset3,
+        instance,
+        tags={ASSET_PARTITION_RANGE_START_TAG: "alpha", ASSET_PARTITION_RANGE_END_TAG: "beta"},
+    )
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset3.key, "alpha") == StaleStatus.FRESH
+    assert status_resolver.get_status(asset3.key, "beta") == StaleStatus.FRESH
+
+    materialize_asset(
+        all_assets,
+        asset1,
+        instance,
+        partition_key="alpha",
+        run_config=dg.RunConfig({"asset1": AssetConfig(value=2)}),
+    )
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key, "alpha") == StaleStatus.FRESH
+    assert status_resolver.get_status(asset1.key, "beta") == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key) == StaleStatus.STALE
+    assert status_resolver.get_status(asset3.key, "alpha") == StaleStatus.FRESH
+    assert status_resolver.get_status(asset3.key, "beta") == StaleStatus.FRESH
+    assert status_resolver.get_stale_causes(asset2.key) == [
+        StaleCause(
+            asset2.key,
+            StaleCauseCategory.DATA,
+            "has a new dependency data version",
+            a1_alpha_key,
+            [
+                StaleCause(a1_alpha_key, StaleCauseCategory.DATA, "has a new data version"),
+            ],
         )
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key, "alpha") == StaleStatus.FRESH
-        assert status_resolver.get_status(asset1.key, "beta") == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key) == StaleStatus.STALE
-        assert status_resolver.get_status(asset3.key, "alpha") == StaleStatus.FRESH
-        assert status_resolver.get_status(asset3.key, "beta") == StaleStatus.FRESH
-        assert status_resolver.get_stale_causes(asset2.key) == [
-            StaleCause(
-                asset2.key,
-                StaleCauseCategory.DATA,
-                "has a new dependency data version",
-                a1_alpha_key,
-                [
-                    StaleCause(a1_alpha_key, StaleCauseCategory.DATA, "has a new data version"),
-                ],
-            )
-        ]
-
-        # Now both partitions should show up in stale reasons
-        materialize_asset(
-            all_assets,
-            asset1,
-            instance,
-            partition_key="beta",
-            run_config=dg.RunConfig({"asset1": AssetConfig(value=2)}),
+    ]
+
+    # Now both partitions should show up in stale reasons
+    materialize_asset(
+        all_assets,
+        asset1,
+        instance,
+        partition_key="beta",
+        run_config=dg.RunConfig({"asset1": AssetConfig(value=2)}),
+    )
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_stale_causes(asset2.key) == [
+        StaleCause(
+            asset2.key,
+            StaleCauseCategory.DATA,
+            "has a new dependency data version",
+            dep_key,
+            [
+                StaleCause(dep_key, StaleCauseCategory.DATA, "has a new data version"),
+            ],
         )
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_stale_causes(asset2.key) == [
-            StaleCause(
-                asset2.key,
-                StaleCauseCategory.DATA,
-                "has a new dependency data version",
-                dep_key,
-                [
-                    StaleCause(dep_key, StaleCauseCategory.DATA, "has a new data version"),
-                ],
-            )
-            for dep_key in [a1_alpha_key, a1_beta_key]
-        ]
-        assert status_resolver.get_status(asset3.key, "alpha") == StaleStatus.FRESH
+        for dep_key in [a1_alpha_key, a1_beta_key]
+    ]
+    assert status_resolver.get_status(asset3.key, "alpha") == StaleStatus.FRESH
 
-        materialize_asset(all_assets, asset2, instance)
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
-        assert status_resolver.get_status(asset3.key, "alpha") == StaleStatus.STALE
-        assert status_resolver.get_status(asset3.key, "beta") == StaleStatus.STALE
+    materialize_asset(all_assets, asset2, instance)
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
+    assert status_resolver.get_status(asset3.key, "alpha") == StaleStatus.STALE
+    assert status_resolver.get_status(asset3.key, "beta") == StaleStatus.STALE
 
 
-@pytest.mark.parametrize(
-    ("num_partitions", "expected_status"),
-    [
-        (2, StaleStatus.STALE),  # under threshold
-        (3, StaleStatus.FRESH),  # over threshold
-    ],
-)
-def test_stale_status_self_partitioned(num_partitions: int, expected_status: StaleStatus) -> None:
+def test_stale_status_self_partitioned(instance) -> None:
     start_date = datetime(2020, 1, 1)
-    end_date = start_date + timedelta(days=num_partitions)
+    end_date = start_date + timedelta(days=2)
 
     partitions_def = dg.DailyPartitionsDefinition(start_date=start_date, end_date=end_date)
     start_key = start_date.strftime("%Y-%m-%d")
@@ -690,34 +707,41 @@ def asset1(asset1):
         return 1 if asset1 is None else asset1 + 1
 
     all_assets = [asset1]
-    with dg.instance_for_test() as instance:
-        for k in partitions_def.get_partition_keys():
-            materialize_asset(all_assets, asset1, instance, partition_key=k)
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        for k in partitions_def.get_partition_keys():
-            assert status_resolver.get_status(asset1.key, k) == StaleStatus.FRESH
-
-        materialize_asset(
-            all_assets,
-            asset1,
-            instance,
-            partition_key=start_key,
-        )
+    partition_keys = partitions_def.get_partition_keys()
+    for k in partition_keys:
+        materialize_asset(all_assets, asset1, instance, partition_key=k)
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    for k in partition_keys:
+        assert status_resolver.get_status(asset1.key, k) == StaleStatus.FRESH
+
+    materialize_asset(
+        all_assets,
+        asset1,
+        instance,
+        partition_key=start_key,
+    )
+
+    # Check both sides of the threshold against the same materializations, using a new resolver
+    # for each since resolved statuses are cached.
+    for threshold, expected_status in [
+        (3, StaleStatus.STALE),  # under threshold
+        (2, StaleStatus.FRESH),  # at/over threshold
+    ]:
         status_resolver = get_stale_status_resolver(instance, all_assets)
         with mock.patch(
             "dagster._core.definitions.data_version.SKIP_PARTITION_DATA_VERSION_SELF_DEPENDENCY_THRESHOLD",
-            3,
+            threshold,
         ):
             # In the under-threshold case, this should return STALE since we updated an upstream
             # partition.
             #
             # In the over-threshold case, even though we introduced a new data version to an
-            # upstream partition, this should return FRESH because the number of self-partitions is
-            # > SKIP_PARTITION_DATA_VERSION_SELF_DEPENDENCY_THRESHOLD
+            # upstream partition, this should return FRESH because the number of self-partitions
+            # is >= SKIP_PARTITION_DATA_VERSION_SELF_DEPENDENCY_THRESHOLD
             assert status_resolver.get_status(asset1.key, end_key) == expected_status
 
 
-def test_stale_status_manually_versioned() -> None:
+def test_stale_status_manually_versioned(instance) -> None:
     @dg.asset(config_schema={"value": dg.Field(int)})
     def asset1(context):
         value = context.op_execution_context.op_config["value"]
@@ -729,63 +753,56 @@ def asset2(context, asset1):
         return dg.Output(value, data_version=dg.DataVersion(str(value)))
 
     all_assets = [asset1, asset2]
-    with dg.instance_for_test() as instance:
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key) == StaleStatus.MISSING
-        assert status_resolver.get_status(asset2.key) == StaleStatus.MISSING
-
-        materialize_assets(
-            [asset1, asset2],
-            instance=instance,
-            run_config={
-                "ops": {"asset1": {"config": {"value": 1}}, "asset2": {"config": {"value": 1}}}
-            },
-        )
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
-
-        materialize_asset(
-            [asset1],
-            asset1,
-            instance=instance,
-            run_config={"ops": {"asset1": {"config": {"value": 2}}}},
-        )
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key) == StaleStatus.STALE
-        assert status_resolver.get_stale_causes(asset2.key) == [
-            StaleCause(
-                asset2.key,
-                StaleCauseCategory.DATA,
-                "has a new dependency data version",
-                asset1.key,
-                [
-                    StaleCause(asset1.key, StaleCauseCategory.DATA, "has a new data version"),
-                ],
-            ),
-        ]
-
-        # rematerialize with the old value, asset2 should be fresh again
-        materialize_asset(
-            [asset1],
-            asset1,
-            instance=instance,
-            run_config={"ops": {"asset1": {"config": {"value": 1}}}},
-        )
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key) == StaleStatus.MISSING
+    assert status_resolver.get_status(asset2.key) == StaleStatus.MISSING
 
+    materialize_assets(
+        [asset1, asset2],
+        instance=instance,
+        run_config={
+            "ops": {"asset1": {"config": {"value": 1}}, "asset2": {"config": {"value": 1}}}
+        },
+    )
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
 
-def test_stale_status_non_transitive_root_causes() -> None:
-    x = 0
+    materialize_asset(
+        [asset1],
+        asset1,
+        instance=instance,
+        run_config={"ops": {"asset1": {"config": {"value": 2}}}},
+    )
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key) == StaleStatus.STALE
+    assert status_resolver.get_stale_causes(asset2.key) == [
+        StaleCause(
+            asset2.key,
+            StaleCauseCategory.DATA,
+            "has a new dependency data version",
+            asset1.key,
+            [
+                StaleCause(asset1.key, StaleCauseCategory.DATA, "has a new data version"),
+            ],
+        ),
+    ]
+
+    # rematerialize with the old value, asset2 should be fresh again
+    materialize_asset(
+        [asset1],
+        asset1,
+        instance=instance,
+        run_config={"ops": {"asset1": {"config": {"value": 1}}}},
+    )
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
 
-    @dg.observable_source_asset
-    def source1(_context):
-        nonlocal x
-        x = x + 1
-        return dg.DataVersion(str(x))
+
+def test_stale_status_non_transitive_root_causes(instance) -> None:
+    source1 = _make_counting_source()
 
     @dg.asset(code_version="1")
     def asset1(source1): ...
@@ -796,71 +813,67 @@ def asset2(asset1): ...
     @dg.asset(code_version="1")
     def asset3(asset2): ...
 
-    with dg.instance_for_test() as instance:
-        all_assets = [source1, asset1, asset2, asset3]
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_stale_root_causes(asset1.key) == []
-        assert status_resolver.get_stale_root_causes(asset2.key) == []
-
-        materialize_assets(all_assets, instance)
-
-        # Simulate updating an asset with a new code version
-        @dg.asset(name="asset1", code_version="2")
-        def asset1_v2(source1): ...
-
-        all_assets = [source1, asset1_v2, asset2, asset3]
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key) == StaleStatus.STALE
-        assert status_resolver.get_stale_root_causes(asset1.key) == [
-            StaleCause(asset1.key, StaleCauseCategory.CODE, "has a new code version")
-        ]
-        assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
-        assert status_resolver.get_stale_root_causes(asset2.key) == []
-        assert status_resolver.get_status(asset3.key) == StaleStatus.FRESH
-        assert status_resolver.get_stale_root_causes(asset3.key) == []
-
-        observe([source1], instance=instance)
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key) == StaleStatus.STALE
-        assert status_resolver.get_stale_root_causes(asset1.key) == [
-            StaleCause(asset1.key, StaleCauseCategory.CODE, "has a new code version"),
-            StaleCause(source1.key, StaleCauseCategory.DATA, "has a new data version"),
-        ]
-        assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
-        assert status_resolver.get_stale_root_causes(asset2.key) == []
-        assert status_resolver.get_status(asset3.key) == StaleStatus.FRESH
-        assert status_resolver.get_stale_root_causes(asset3.key) == []
-
-        materialize_assets(all_assets, instance=instance, selection=[asset1])
-        status_resolver = get_stale_status_resolver(instance, all_assets)
-        assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
-        assert status_resolver.get_status(asset2.key) == StaleStatus.STALE
-        assert status_resolver.get_stale_root_causes(asset2.key) == [
-            StaleCause(asset1.key, StaleCauseCategory.DATA, "has a new data version"),
-        ]
-        assert status_resolver.get_status(asset3.key) == StaleStatus.FRESH
-        assert status_resolver.get_stale_root_causes(asset3.key) == []
+    all_assets = [source1, asset1, asset2, asset3]
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_stale_root_causes(asset1.key) == []
+    assert status_resolver.get_stale_root_causes(asset2.key) == []
 
+    materialize_assets(all_assets, instance)
 
-def test_no_provenance_stale_status():
+    # Simulate updating an asset with a new code version
+    @dg.asset(name="asset1", code_version="2")
+    def asset1_v2(source1): ...
+
+    all_assets = [source1, asset1_v2, asset2, asset3]
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key) == StaleStatus.STALE
+    assert status_resolver.get_stale_root_causes(asset1.key) == [
+        StaleCause(asset1.key, StaleCauseCategory.CODE, "has a new code version")
+    ]
+    assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
+    assert status_resolver.get_stale_root_causes(asset2.key) == []
+    assert status_resolver.get_status(asset3.key) == StaleStatus.FRESH
+    assert status_resolver.get_stale_root_causes(asset3.key) == []
+
+    observe([source1], instance=instance)
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key) == StaleStatus.STALE
+    assert status_resolver.get_stale_root_causes(asset1.key) == [
+        StaleCause(asset1.key, StaleCauseCategory.CODE, "has a new code version"),
+        StaleCause(source1.key, StaleCauseCategory.DATA, "has a new data version"),
+    ]
+    assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
+    assert status_resolver.get_stale_root_causes(asset2.key) == []
+    assert status_resolver.get_status(asset3.key) == StaleStatus.FRESH
+    assert status_resolver.get_stale_root_causes(asset3.key) == []
+
+    materialize_assets(all_assets, instance=instance, selection=[asset1])
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
+    assert status_resolver.get_status(asset2.key) == StaleStatus.STALE
+    assert status_resolver.get_stale_root_causes(asset2.key) == [
+        StaleCause(asset1.key, StaleCauseCategory.DATA, "has a new data version"),
+    ]
+    assert status_resolver.get_status(asset3.key) == StaleStatus.FRESH
+    assert status_resolver.get_stale_root_causes(asset3.key) == []
+
+
+def test_no_provenance_stale_status(instance):
     @dg.asset
     def foo(bar):
         return 1
 
     bar = dg.SourceAsset(dg.AssetKey(["bar"]))
 
-    with dg.instance_for_test() as instance:
-        materialization = dg.AssetMaterialization(asset_key=dg.AssetKey(["foo"]))
-        entry = create_test_event_log_entry(DagsterEventType.ASSET_MATERIALIZATION, materialization)
-        instance.store_event(entry)
-        status_resolver = get_stale_status_resolver(instance, [foo, bar])
-        assert status_resolver.get_status(foo.key) == StaleStatus.FRESH
-        assert status_resolver.get_stale_root_causes(foo.key) == []
-
+    materialization = dg.AssetMaterialization(asset_key=dg.AssetKey(["foo"]))
+    entry = create_test_event_log_entry(DagsterEventType.ASSET_MATERIALIZATION, materialization)
+    instance.store_event(entry)
+    status_resolver = get_stale_status_resolver(instance, [foo, bar])
+    assert status_resolver.get_status(foo.key) == StaleStatus.FRESH
+    assert status_resolver.get_stale_root_causes(foo.key) == []
 
-def test_get_data_provenance_inside_op():
-    instance = DagsterInstance.ephemeral()
 
+def test_get_data_provenance_inside_op(instance):
     @dg.asset
     def asset1():
         return dg.Output(1, data_version=dg.DataVersion("foo"))
@@ -884,7 +897,7 @@ def asset2(context: AssetExecutionContext, asset1):
 
 
 # use old logical version tags
-def test_legacy_data_version_tags():
+def test_legacy_data_version_tags(instance):
     @dg.asset
     def foo():
         return dg.Output(1, data_version=dg.DataVersion("alpha"))
@@ -893,35 +906,35 @@ def foo():
     def bar(foo):
         return dg.Output(foo + 1, data_version=dg.DataVersion("beta"))
 
-    with dg.instance_for_test() as instance:
-
-        def mocked_get_input_data_version_tag(
-            input_key: AssetKey, prefix: str = "dagster/input_logical_version"
-        ) -> str:
-            return f"{prefix}/{input_key.to_user_string()}"
-
-        legacy_tags = {
-            "DATA_VERSION_TAG": "dagster/logical_version",
-            "get_input_data_version_tag": mocked_get_input_data_version_tag,
-        }
-
-        # This will create materializations with the legacy tags
-        with mock.patch.dict("dagster._core.execution.plan.execute_step.__dict__", legacy_tags):
-            mats = materialize_assets([foo, bar], instance)
-            assert mats["bar"].tags["dagster/logical_version"]  # pyright: ignore[reportOptionalSubscript]
-            assert mats["bar"].tags["dagster/input_logical_version/foo"]  # pyright: ignore[reportOptionalSubscript]
-            assert mats["bar"].tags["dagster/input_event_pointer/foo"]  # pyright: ignore[reportOptionalSubscript]
-
-        # We're now outside the mock context
-        record = instance.get_latest_data_version_record(bar.key)
-        assert record
-        assert extract_data_version_from_entry(record.event_log_entry) == dg.DataVersion("beta")
-        assert extract_data_provenance_from_entry(record.event_log_entry) == dg.DataProvenance(
-            code_version="1",
-            input_data_versions={dg.AssetKey(["foo"]): dg.DataVersion("alpha")},
-            input_storage_ids={dg.AssetKey(["foo"]): 4},
-            is_user_provided=True,
-        )
+    def mocked_get_input_data_version_tag(
+        input_key: AssetKey, prefix: str = "dagster/input_logical_version"
+    ) -> str:
+        return f"{prefix}/{input_key.to_user_string()}"
+
+    legacy_tags = {
+        "DATA_VERSION_TAG": "dagster/logical_version",
+        "get_input_data_version_tag": mocked_get_input_data_version_tag,
+    }
+
+    # This will create materializations with the legacy tags
+    with mock.patch.dict("dagster._core.execution.plan.execute_step.__dict__", legacy_tags):
+        mats = materialize_assets([foo, bar], instance)
+        assert mats["bar"].tags["dagster/logical_version"]  # pyright: ignore[reportOptionalSubscript]
+        assert mats["bar"].tags["dagster/input_logical_version/foo"]  # pyright: ignore[reportOptionalSubscript]
+        assert mats["bar"].tags["dagster/input_event_pointer/foo"]  # pyright: ignore[reportOptionalSubscript]
+
+    # We're now outside the mock context
+    foo_record = instance.get_latest_data_version_record(foo.key)
+    assert foo_record
+    record = instance.get_latest_data_version_record(bar.key)
+    assert record
+    assert extract_data_version_from_entry(record.event_log_entry) == dg.DataVersion("beta")
+    assert extract_data_provenance_from_entry(record.event_log_entry) == dg.DataProvenance(
+        code_version="1",
+        input_data_versions={dg.AssetKey(["foo"]): dg.DataVersion("alpha")},
+        input_storage_ids={dg.AssetKey(["foo"]): foo_record.storage_id},
+        is_user_provided=True,
+    )
 
 
 def test_stale_cause_comparison():
@@ -937,7 +950,7 @@ def test_stale_cause_comparison():
 # represent an SDA-style materialization generated by a parallel run. If the data version matches
 # the step-internal materialization, no warning is emitted. If it does not match, a warning is
 # emitted and the most recent materialization is used for provenance.
-def test_most_recent_materialization_used(capsys):
+def test_most_recent_materialization_used(instance, capsys):
     class FooBarConfig(dg.Config):
         external_foo_data_version: str
 
@@ -952,24 +965,23 @@ def foo_bar(config: FooBarConfig):
         )
         yield dg.Output(2, output_name="bar")
 
-    with dg.instance_for_test() as instance:
-        dg.materialize(
-            [foo_bar],
-            instance=instance,
-            run_config={"ops": {"foo_bar": {"config": {"external_foo_data_version": "beta"}}}},
-        )
-        captured = capsys.readouterr()
-        message = "Data version mismatch"
-        assert re.search(message, captured.err, re.MULTILINE)
-        mat = instance.get_latest_materialization_event(dg.AssetKey("bar"))
-        assert mat and mat.asset_materialization
-        assert (
-            get_upstream_version_from_mat_provenance(mat.asset_materialization, dg.AssetKey("foo"))
-            == "beta"
-        )
+    dg.materialize(
+        [foo_bar],
+        instance=instance,
+        run_config={"ops": {"foo_bar": {"config": {"external_foo_data_version": "beta"}}}},
+    )
+    captured = capsys.readouterr()
+    message = "Data version mismatch"
+    assert message in captured.err
+    mat = instance.get_latest_materialization_event(dg.AssetKey("bar"))
+    assert mat and mat.asset_materialization
+    assert (
+        get_upstream_version_from_mat_provenance(mat.asset_materialization, dg.AssetKey("foo"))
+        == "beta"
+    )
 
 
-def test_materialize_result_overwrite_provenance_tag():
+def test_materialize_result_overwrite_provenance_tag(instance):
     @dg.asset
     def asset0(): ...
 
@@ -977,17 +989,16 @@ def asset0(): ...
     def asset1():
         return dg.MaterializeResult(tags={"dagster/input_event_pointer/asset0": 500})  # pyright: ignore[reportArgumentType]
 
-    with dg.instance_for_test() as instance:
-        dg.materialize([asset0], instance=instance)
-        dg.materialize([asset1], instance=instance)
+    dg.materialize([asset0], instance=instance)
+    dg.materialize([asset1], instance=instance)
 
-        record = instance.get_latest_data_version_record(asset1.key)
-        assert extract_data_provenance_from_entry(record.event_log_entry).input_storage_ids == {  # pyright: ignore[reportOptionalMemberAccess]
-            dg.AssetKey(["asset0"]): 500
-        }
+    record = instance.get_latest_data_version_record(asset1.key)
+    assert extract_data_provenance_from_entry(record.event_log_entry).input_storage_ids == {  # pyright: ignore[reportOptionalMemberAccess]
+        dg.AssetKey(["asset0"]): 500
+    }
 
 
-def test_output_overwrite_provenance_tag():
+def test_output_overwrite_provenance_tag(instance):
     @dg.asset
     def asset0(): ...
 
@@ -995,17 +1006,16 @@ def asset0(): ...
     def asset1():
         return dg.Output(value=None, tags={"dagster/input_event_pointer/asset0": 500})  # pyright: ignore[reportArgumentType]
 
-    with dg.instance_for_test() as instance:
-        dg.materialize([asset0], instance=instance)
-        dg.materialize([asset1], instance=instance)
+    dg.materialize([asset0], instance=instance)
+    dg.materialize([asset1], instance=instance)
 
-        record = instance.get_latest_data_version_record(asset1.key)
-        assert extract_data_provenance_from_entry(record.event_log_entry).input_storage_ids == {  # pyright: ignore[reportOptionalMemberAccess]
-            dg.AssetKey(["asset0"]): 500
-        }
+    record = instance.get_latest_data_version_record(asset1.key)
+    assert extract_data_provenance_from_entry(record.event_log_entry).input_storage_ids == {  # pyright: ignore[reportOptionalMemberAccess]
+        dg.AssetKey(["asset0"]): 500
+    }
 
 
-def test_fan_in():
+def test_fan_in(instance):
     def create_upstream_asset(i: int):
         @dg.asset(name=f"upstream_asset_{i}", code_version="abc")
         def upstream_asset():
@@ -1023,7 +1033,6 @@ def downstream_asset(**kwargs):
         return kwargs.values()
 
     all_assets = [*upstream_assets, downstream_asset]
-    instance = DagsterInstance.ephemeral()
     materialize_assets(all_assets, instance)
 
     counter = Counter()
@@ -1036,3 +1045,10 @@ def downstream_asset(**kwargs):
             "DagsterInstance.get_run_record_by_id": 3,  # get_run_record_by_id called when handling events for the run
         }
     )
+
+    # Resolving the downstream status fetches the asset records of all upstreams in one batch
+    counter = Counter()
+    traced_counter.set(counter)
+    status_resolver = get_stale_status_resolver(instance, all_assets)
+    assert status_resolver.get_status(downstream_asset.key) == StaleStatus.FRESH
+    assert counter.counts() == {"DagsterInstance.get_asset_records": 2}
@@ -33,16 +33,16 @@ def asset_fn(_):
 
 
 def build_asset_for_task(task_name: str, prev_asset_specs: list[AssetSpec]) -> AssetsDefinition:
+    # Create a bunch of dependencies for each asset, all on the previous task's assets.
+    prev_asset_keys = tuple(spec.key for spec in prev_asset_specs)
     specs = [
-        # Create a bunch of dependencies for each asset.
-        AssetSpec(f"{task_name}_asset_{i}", deps=[spec.key for spec in prev_asset_specs])
-        for i in range(get_num_assets())
+        AssetSpec(f"{task_name}_asset_{i}", deps=prev_asset_keys) for i in range(get_num_assets())
     ]
     return build_asset(specs)
 
 
 def get_dag_defs() -> Definitions:
-    all_dag_defs = []
+    all_assets = []
     prev_asset_specs: list[AssetSpec] = []
     for i in range(get_num_dags()):
         dag_id = f"dag_{i}"
@@ -52,15 +52,13 @@ def get_dag_defs() -> Definitions:
             asset = build_asset_for_task(task_name, prev_asset_specs)
             task_mappings[task_name] = [asset]
             prev_asset_specs = asset.specs  # type: ignore
-        all_dag_defs.append(
-            Definitions(
-                assets=assets_with_task_mappings(
-                    dag_id=dag_id,
-                    task_mappings=task_mappings,
-                )
+        all_assets.extend(
+            assets_with_task_mappings(
+                dag_id=dag_id,
+                task_mappings=task_mappings,
             )
         )
-    return Definitions.merge(*all_dag_defs)
+    return Definitions(assets=all_assets)
 
 
 defs = build_defs_from_airflow_instance(airflow_instance=airflow_instance, defs=get_dag_defs())